@@ -29,28 +29,26 @@ cdef convert_way_records_to_lists(ways, tags_to_separate_as_arrays):
     cdef int i
     cdef int n = len(ways)
 
-    lookup = dict.fromkeys(tags_to_separate_as_arrays, None)
-    data = {k: [] for k in tags_to_separate_as_arrays}
-    data["tags"] = []
+    # Preallocate the columns, so that values can be written directly
+    # into their position without building a record for every way
+    data = {k: [None] * n for k in tags_to_separate_as_arrays}
+    tags = [None] * n
 
     for i in range(0, n):
         way = ways[i]
-        way_records = dict.fromkeys(tags_to_separate_as_arrays, None)
         other_tags = {}
         for k, v in way.items():
-            try:
-                # Check if tag should be kept as a column
-                lookup[k]
-                way_records[k] = v
-            except:
+            # Check if tag should be kept as a column
+            column = data.get(k)
+            if column is not None:
+                column[i] = v
+            else:
                 # If not add into tags
                 other_tags[k] = v
-        [data[k].append(v) for k, v in way_records.items()]
         if len(other_tags) > 0:
-            data["tags"].append(dumps(other_tags))
-        else:
-            data["tags"].append(None)
+            tags[i] = dumps(other_tags)
 
+    data["tags"] = tags
     return data
 
 cdef convert_to_arrays_and_drop_empty(data):
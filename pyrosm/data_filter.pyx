@@ -4,39 +4,41 @@ from cykhash import isin_int64
 from cpython cimport array
 
 
-class Solver:
-    """Solver is used to toggle between exclude / keep checks applied in data filter."""
-    def __init__(self, direction):
-
-        if direction == "exclude":
-            self.solver = self.isin_check
-        elif direction == "keep":
-            self.solver = self.notin_check
+cdef get_filter_lookup(data_filter):
+    """
+    Converts the values of a data filter into sets, so that checking
+    whether a tag value matches with the filter is a single hash lookup
+    instead of scanning through the list of values for every element.
+    """
+    lookup = {}
+    for key, values in data_filter.items():
+        if values is True or isinstance(values, str):
+            values = [values]
+        lookup[key] = frozenset(values)
+    return lookup
+
+cdef split_filter_lookup(data_filter):
+    """
+    Splits the data filter into keys that accept any value ({'osm_key': True})
+    and a lookup of keys that require specific values.
+    For the former, it is enough to check that the key exists in the element.
+    """
+    any_keys = []
+    value_filter = {}
+    for key, values in get_filter_lookup(data_filter).items():
+        if True in values and len(values) == 1:
+            any_keys.append(key)
         else:
-            raise ValueError("filter type should be 'keep' or 'exclude'")
-
-    def isin_check(self, value, container):
-        if value in container:
+            value_filter[key] = values
+    return any_keys, value_filter
+
+cdef has_osm_data_type(osm_data_types, record):
+    cdef str osm_data_type
+    # Probe the record (dict) with the few requested keys
+    # instead of scanning through all of its tags
+    for osm_data_type in osm_data_types:
+        if osm_data_type in record:
             return True
-        return False
-
-    def notin_check(self, value, container):
-        if value not in container:
-            return True
-        return False
-
-    def check(self, value, container):
-        return self.solver(value, container)
-
-
-cdef has_osm_data_type(osm_data_types, tag_keys):
-    cdef str key, osm_data_type
-    cdef int i, n = len(tag_keys)
-    for i in range(0, n):
-        key = tag_keys[i]
-        for osm_data_type in osm_data_types:
-            if osm_data_type == key:
-                return True
     return False
 
 cdef way_is_part_of_relation(way_record, lookup_dict):
@@ -84,10 +86,11 @@ cdef filter_osm_records(data_records,
         Whether the given data_filter should 'keep' or 'exclude' the records 
         where given tag:value pair is present in the record.  
     """
-    cdef str rec_value
     cdef int i, N = len(data_records)
 
-    solver = Solver(filter_type)
+    if filter_type not in ["keep", "exclude"]:
+        raise ValueError("filter type should be 'keep' or 'exclude'")
+    exclude = filter_type == "exclude"
     filtered_data = []
 
     if not isinstance(osm_data_type, list):
@@ -118,8 +121,7 @@ cdef filter_osm_records(data_records,
         if len(way_filter) == 0:
             data_filter = None
         else:
-            data_filter = {k: v for k, v in way_filter.items()}
-            filter_keys = list(data_filter.keys())
+            data_filter = get_filter_lookup(way_filter)
 
         # Check for overlapping filter
         if len(filter_values) > len(list(set(filter_values))):
@@ -132,7 +134,6 @@ cdef filter_osm_records(data_records,
 
     for i in range(0, N):
         record = data_records[i]
-        record_keys = list(record.keys())
         # If way is part of relation it should be kept
         # (ways that are part of relation might not have any tags)
         if relation_check:
@@ -140,7 +141,7 @@ cdef filter_osm_records(data_records,
                 filtered_data.append(record)
                 continue
 
-        if not has_osm_data_type(osm_data_type, record_keys):
+        if not has_osm_data_type(osm_data_type, record):
             continue
 
         # Check if should be filtered based on given data_filter
@@ -149,9 +150,11 @@ cdef filter_osm_records(data_records,
             filter_was_in_record = False
 
             for k, v in record.items():
-                if k in filter_keys:
+                if k in data_filter:
                     filter_was_in_record = True
-                    if solver.check(v, data_filter[k]):
+                    # When excluding, a match filters the record out,
+                    # when keeping, a mismatch does
+                    if (v in data_filter[k]) == exclude:
                         filter_out = True
                         # If there are identical filter criteria used in multiple OSM-keys
                         # Check that none of them matches, hence do not break the loop
@@ -205,64 +208,46 @@ cdef nodes_for_way_exist_khash(nodes, node_lookup):
         return True
     return False
 
-cdef record_should_be_kept(tag, osm_keys, data_filter, filter_type):
+cdef record_should_be_kept(tag, osm_keys, any_keys, value_filter, bint keep):
     if tag is None:
         return False
 
-    cdef str k, osm_key
-    filter_keys = list(data_filter.keys())
-    tag_keys = list(tag.keys())
-
-    # Check if OSM key exist for the given element
-    osm_key_was_found = False
-    for osm_key in osm_keys:
-        if osm_key in tag_keys:
-            osm_key_was_found = True
+    cdef str k
 
-    # If not, the element shouldn't be kept
-    if not osm_key_was_found:
+    # Check if OSM key exist for the given element,
+    # if not, the element shouldn't be kept
+    if not has_osm_data_type(osm_keys, tag):
         return False
 
     # If there is no filter but the element is correct kind
-    if len(filter_keys) == 0:
-        if filter_type == "keep":
-            return True
-        else:
-            return False
+    if len(any_keys) == 0 and len(value_filter) == 0:
+        return keep
+
+    # If there is a filter, check if match is found.
+    # 'keep' and 'exclude' share the same check,
+    # only the outcome of a match is reversed.
 
-    # If there is a filter, check if match is found
-    for k, v in data_filter.items():
-        if k in tag_keys:
-            # Check match with data filter
+    # Filters defined as {'osm_key': True} match with any value
+    if has_osm_data_type(any_keys, tag):
+        return keep
+
+    # Check match with data filter
+    for k, v in value_filter.items():
+        if k in tag:
             if tag[k] in v:
-                if filter_type == "keep":
-                    return True
-                else:
-                    return False
-            # If filter is not defined, check for 'osm_key': True
-            elif v == [True] or v == True:
-                if filter_type == "keep":
-                    return True
-                else:
-                    return False
-
-    if filter_type == "keep":
-        return False
-    return True
+                return keep
+
+    return not keep
 
 cdef filter_relation_indices(relations, osm_keys, data_filter, filter_type):
     cdef int i, n = len(relations["tags"])
     indices = []
 
-    # Ensure keys
-    if len(data_filter) == 0:
-        relation_filter = {}
-    else:
-        relation_filter = {key: value for key, value in data_filter.items()}
-
+    any_keys, value_filter = split_filter_lookup(data_filter)
+    keep = filter_type == "keep"
     for i in range(0, n):
         tag = relations["tags"][i]
-        if record_should_be_kept(tag, osm_keys, relation_filter, filter_type):
+        if record_should_be_kept(tag, osm_keys, any_keys, value_filter, keep):
             indices.append(i)
     return indices
 
@@ -270,14 +255,11 @@ cdef filter_node_indices(node_arrays, osm_keys, data_filter, filter_type):
     cdef int i, n = len(node_arrays["tags"])
     indices = []
 
-    if len(data_filter) == 0:
-        node_filter = {}
-    else:
-        node_filter = {key: value for key, value in data_filter.items()}
-
+    any_keys, value_filter = split_filter_lookup(data_filter)
+    keep = filter_type == "keep"
     for i in range(0, n):
         tag = node_arrays["tags"][i]
-        if record_should_be_kept(tag, osm_keys, node_filter, filter_type):
+        if record_should_be_kept(tag, osm_keys, any_keys, value_filter, keep):
             indices.append(i)
 
     return indices
\ No newline at end of file
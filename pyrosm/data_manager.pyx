@@ -43,16 +43,25 @@ cdef get_data_filter_and_osm_keys(custom_filter):
                          f"Got {custom_filter} with type {type(custom_filter)}.")
 
 
+cdef select_filtered_arrays(array_dict, indices):
+    # Indices are in ascending order, hence, if every element passed
+    # the filter, the original arrays can be used as they are
+    # instead of copying them
+    if len(indices) == len(array_dict["tags"]):
+        return {k: v for k, v in array_dict.items()}
+    return filter_array_dict_by_indices_or_mask(array_dict, indices)
+
 cdef get_relation_arrays(relations, osm_keys, data_filter, filter_type):
-    # Combine all blocks
-    relations = concatenate_dicts_of_arrays(relations)
+    # Combine all blocks (if not done already)
+    if isinstance(relations, list):
+        relations = concatenate_dicts_of_arrays(relations)
     # Get indices for MultiPolygons that also passes data_filter
     indices = filter_relation_indices(relations, osm_keys, data_filter, filter_type)
     # If no building relations were found, return None
     if len(indices) == 0:
         return None
     # Otherwise, filter the data accordingly
-    return filter_array_dict_by_indices_or_mask(relations, indices)
+    return select_filtered_arrays(relations, indices)
 
 cdef separate_relation_ways(way_records, relation_way_ids):
     cdef int i, n = len(way_records)
@@ -70,7 +79,15 @@ cdef separate_relation_ways(way_records, relation_way_ids):
             normal_ways.append(way)
     return normal_ways, relation_ways
 
-cdef get_way_arrays(way_records, relation_way_ids, osm_keys, tags_as_columns, data_filter, filter_type):
+cdef get_way_arrays(way_records, relation_way_ids, osm_keys, tags_as_columns, data_filter, filter_type, keep_ways):
+    # If ways themselves are not requested, only the ones that are
+    # part of relations need to be processed any further
+    if not keep_ways:
+        if relation_way_ids is None:
+            return None, None
+        relation_ids = dict.fromkeys(relation_way_ids, None)
+        way_records = [way for way in way_records if way["id"] in relation_ids]
+
     # Get all ways including the ones associated with relations
     ways = filter_osm_records(way_records,
                       data_filter,
@@ -92,7 +109,7 @@ cdef get_way_arrays(way_records, relation_way_ids, osm_keys, tags_as_columns, da
             relation_arrays = convert_to_arrays_and_drop_empty(relation_ways)
 
     # Process separated ways
-    if len(ways) > 0:
+    if len(ways) > 0 and keep_ways:
         ways = convert_way_records_to_lists(ways, tags_as_columns)
         way_arrays = convert_to_arrays_and_drop_empty(ways)
     else:
@@ -100,10 +117,10 @@ cdef get_way_arrays(way_records, relation_way_ids, osm_keys, tags_as_columns, da
 
     return way_arrays, relation_arrays
 
-cpdef _get_osm_ways_and_relations(way_records, relations, osm_keys, tags_as_columns, data_filter, filter_type):
-    return get_osm_ways_and_relations(way_records, relations, osm_keys, tags_as_columns, data_filter, filter_type)
+cpdef _get_osm_ways_and_relations(way_records, relations, osm_keys, tags_as_columns, data_filter, filter_type, keep_ways=True):
+    return get_osm_ways_and_relations(way_records, relations, osm_keys, tags_as_columns, data_filter, filter_type, keep_ways)
 
-cdef get_osm_ways_and_relations(way_records, relations, osm_keys, tags_as_columns, data_filter, filter_type):
+cdef get_osm_ways_and_relations(way_records, relations, osm_keys, tags_as_columns, data_filter, filter_type, keep_ways):
 
     # Tags that should always be kept
     tags_as_columns += ["id", "nodes", "timestamp", "version"]
@@ -134,7 +151,8 @@ cdef get_osm_ways_and_relations(way_records, relations, osm_keys, tags_as_column
                                          osm_keys,
                                          tags_as_columns,
                                          data_filter,
-                                         filter_type)
+                                         filter_type,
+                                         keep_ways)
 
     # If relation ways could not be parsed, also relations should be returned as None
     if relation_ways is None:
@@ -153,7 +171,7 @@ cdef get_osm_nodes(node_arrays, osm_keys, tags_as_columns, data_filter, filter_t
     if len(indices) == 0:
         return None
     # Otherwise, filter the data accordingly
-    filtered_nodes = filter_array_dict_by_indices_or_mask(node_arrays, indices)
+    filtered_nodes = select_filtered_arrays(node_arrays, indices)
     # Explode tags and update
     tags = explode_tag_array(filtered_nodes["tags"], tags_as_columns)
     for k, v in tags.items():
@@ -161,7 +179,7 @@ cdef get_osm_nodes(node_arrays, osm_keys, tags_as_columns, data_filter, filter_t
             filtered_nodes[k] = v
     return filtered_nodes
 
-cdef _get_osm_data(node_arrays, way_records, relations, tags_as_columns, data_filter, filter_type, osm_keys):
+cdef _get_osm_data(node_arrays, way_records, relations, tags_as_columns, data_filter, filter_type, osm_keys, keep_ways):
     if osm_keys is None:
         # Convert filter to appropriate form and parse keys
         data_filter, osm_keys = get_data_filter_and_osm_keys(data_filter)
@@ -171,8 +189,8 @@ cdef _get_osm_data(node_arrays, way_records, relations, tags_as_columns, data_fi
         node_arrays = get_osm_nodes(node_arrays, osm_keys, tags_as_columns, data_filter, filter_type)
 
     # Parse ways and relations
-    ways, relation_ways, filtered_relations = get_osm_ways_and_relations(way_records, relations, osm_keys, tags_as_columns, data_filter, filter_type)
+    ways, relation_ways, filtered_relations = get_osm_ways_and_relations(way_records, relations, osm_keys, tags_as_columns, data_filter, filter_type, keep_ways)
     return node_arrays, ways, relation_ways, filtered_relations
 
-cpdef get_osm_data(node_arrays, way_records, relations, tags_as_columns, data_filter, filter_type, osm_keys=None):
-    return _get_osm_data(node_arrays, way_records, relations, tags_as_columns, data_filter, filter_type, osm_keys)
+cpdef get_osm_data(node_arrays, way_records, relations, tags_as_columns, data_filter, filter_type, osm_keys=None, keep_ways=True):
+    return _get_osm_data(node_arrays, way_records, relations, tags_as_columns, data_filter, filter_type, osm_keys, keep_ways)
@@ -11,26 +11,28 @@ cpdef create_nodes_gdf(nodes):
     cdef str k
     if isinstance(nodes, list):
         nodes = concatenate_dicts_of_arrays(nodes)
-    df = pd.DataFrame()
-    for k, v in nodes.items():
-        df[k] = v
-    df['geometry'] = _create_point_geometries(nodes['lon'], nodes['lat'])
-    return gpd.GeoDataFrame(df, crs='epsg:4326')
+    geometry = _create_point_geometries(nodes['lon'], nodes['lat'])
+    # Construct the frame directly from the arrays
+    # instead of inserting the columns one by one
+    return gpd.GeoDataFrame({k: v for k, v in nodes.items()},
+                            geometry=geometry,
+                            crs='epsg:4326')
 
 cpdef create_gdf(data_arrays, geometry_array):
     cdef str key
-    df = pd.DataFrame()
+    columns = {}
     for key, data in data_arrays.items():
         # When inserting nodes,
         # those should be converted
         # to lists to avoid block error
         if key == "nodes":
-            df[key] = data.tolist()
+            columns[key] = data.tolist()
         else:
-            df[key] = data
+            columns[key] = data
 
-    df['geometry'] = geometry_array
-    return gpd.GeoDataFrame(df, crs='epsg:4326')
+    return gpd.GeoDataFrame(columns,
+                            geometry=geometry_array,
+                            crs='epsg:4326')
 
 cpdef prepare_way_gdf(node_coordinates, ways):
     if ways is not None:
@@ -1,4 +1,5 @@
 cpdef parse_osm_data(filepath, bounding_box, exclude_relations)
+cpdef decode_primitive_block(zlib_data, int raw_size)
 cdef get_primitive_blocks_and_string_tables(filepath)
 cdef parse_dense(pblock, data, string_table, bounding_box)
 cdef parse_nodes(pblock, data, bounding_box)
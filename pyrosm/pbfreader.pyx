@@ -1,6 +1,8 @@
 from pyrosm.exceptions import PBFNotImplemented
+from concurrent.futures import ThreadPoolExecutor
 from struct import unpack
 import zlib
+import os
 from pyrosm_proto import BlobHeader, Blob, HeaderBlock, PrimitiveBlock
 from pyrosm.tagparser cimport tounicode, parse_dense_tags, parse_tags, explode_way_tags
 from pyrosm._arrays cimport to_clong_array
@@ -10,6 +12,20 @@ from pyrosm.data_filter cimport get_nodeid_lookup_khash, nodes_for_way_exist_kha
 import numpy as np
 from libc.stdlib cimport malloc, free
 
+cpdef decode_primitive_block(zlib_data, int raw_size):
+    # Decompress and parse the block.
+    # The output buffer is allocated once using the uncompressed size
+    # stored in the Blob (if available), instead of growing it repeatedly.
+    if raw_size <= 0:
+        raw_size = zlib.DEF_BUF_SIZE
+    pblock = PrimitiveBlock()
+    pblock.ParseFromString(zlib.decompress(zlib_data, bufsize=raw_size))
+
+    # Get string table and decode
+    str_table = [tounicode(s) for s in pblock.stringtable.s]
+    return pblock, str_table
+
+
 cdef get_primitive_blocks_and_string_tables(filepath):
     cdef int msg_len
     cdef bytes blob_data
@@ -38,38 +54,44 @@ cdef get_primitive_blocks_and_string_tables(filepath):
                     'Required feature %s not implemented!',
                     feature)
 
-        # Gather primitive blocks and string tables
-        primitive_blocks = []
-        string_tables = []
-
-        while True:
-            # Read header
-            buf = f.read(4)
-
-            # Stop when the end has been reached
-            if len(buf) == 0:
-                break
-
-            msg_len = unpack('!L', buf)[0]
-
-            msg = BlobHeader()
-            msg.ParseFromString(f.read(msg_len))
-            blob_header = msg
-
-            # Get data
-            msg = Blob()
-            msg.ParseFromString(f.read(blob_header.datasize))
-            blob_data = zlib.decompress(msg.zlib_data)
-
-            # Get primite block
-            pblock = PrimitiveBlock()
-            pblock.ParseFromString(blob_data)
-
-            # Get string table and decode
-            str_table = [tounicode(s) for s in pblock.stringtable.s]
-
-            primitive_blocks.append(pblock)
-            string_tables.append(str_table)
+        # Blocks are independent of each other, hence they are
+        # decompressed and parsed in parallel while reading the file
+        # (zlib releases the GIL during decompression)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = []
+            while True:
+                # Read header
+                buf = f.read(4)
+
+                # Stop when the end has been reached
+                if len(buf) == 0:
+                    break
+
+                msg_len = unpack('!L', buf)[0]
+
+                msg = BlobHeader()
+                msg.ParseFromString(f.read(msg_len))
+                blob_header = msg
+
+                # Get data
+                msg = Blob()
+                msg.ParseFromString(f.read(blob_header.datasize))
+                futures.append(executor.submit(decode_primitive_block,
+                                               msg.zlib_data,
+                                               msg.raw_size))
+
+            # Gather primitive blocks and string tables (in file order).
+            # Strings that repeat across blocks (e.g. tag keys and common
+            # values) are deduplicated so that they share a single object.
+            # This is done here sequentially, hence, the workers do not
+            # share any state.
+            primitive_blocks = []
+            string_tables = []
+            seen = {}
+            for future in futures:
+                pblock, str_table = future.result()
+                primitive_blocks.append(pblock)
+                string_tables.append([seen.setdefault(s, s) for s in str_table])
 
     return primitive_blocks, string_tables
 
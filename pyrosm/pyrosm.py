@@ -3,8 +3,8 @@ from pyrosm.pbfreader import parse_osm_data
 from pyrosm._arrays import concatenate_dicts_of_arrays
 from pyrosm.geometry import create_node_coordinates_lookup
 from pyrosm.frames import create_nodes_gdf
-from pyrosm.utils import validate_custom_filter, validate_osm_keys, \
-    validate_tags_as_columns, validate_booleans, validate_boundary_type, \
+from pyrosm.utils import validate_custom_criteria, \
+    validate_tags_as_columns, validate_boundary_type, \
     validate_bounding_box, validate_input_file, get_bounding_box
 from pyrosm.utils.download import get_file_size
 from shapely.geometry import Polygon, MultiPolygon, \
@@ -88,9 +88,13 @@ class OSM:
 
         self._nodes = nodes
         self._way_records = ways
-        self._relations = relations
         self._all_way_tags = way_tags
 
+        # Merge relation blocks only once instead of
+        # doing it again every time the data is filtered
+        if len(relations) > 0:
+            self._relations = concatenate_dicts_of_arrays(relations)
+
         # Prepare node coordinates lookup table
         self._node_coordinates = create_node_coordinates_lookup(self._nodes)
 
@@ -561,21 +565,10 @@ class OSM:
 
         """
 
-        # Check that the custom filter is in correct format
-        custom_filter = validate_custom_filter(custom_filter)
-
-        if not isinstance(filter_type, str):
-            raise ValueError("'filter_type' -parameter should be either 'keep' or 'exclude'. ")
-
-        # Validate osm keys
-        validate_osm_keys(osm_keys_to_keep)
-        if isinstance(osm_keys_to_keep, str):
-            osm_keys_to_keep = [osm_keys_to_keep]
-
-        # Validate filter
-        filter_type = filter_type.lower()
-        if filter_type not in ["keep", "exclude"]:
-            raise ValueError("'filter_type' -parameter should be either 'keep' or 'exclude'. ")
+        # Validate all parameters before parsing any data
+        custom_filter, osm_keys_to_keep, filter_type = validate_custom_criteria(
+            custom_filter, osm_keys_to_keep, filter_type, tags_as_columns,
+            keep_nodes, keep_ways, keep_relations, extra_attributes)
 
         # Tags to keep as columns
         if tags_as_columns is None:
@@ -590,17 +583,9 @@ class OSM:
             if len(tags_as_columns) == 0:
                 tags_as_columns = list(custom_filter.keys())
 
-        else:
-            # Validate tags
-            validate_tags_as_columns(tags_as_columns)
-
         if extra_attributes is not None:
-            validate_tags_as_columns(extra_attributes)
             tags_as_columns += extra_attributes
 
-        # Validate booleans
-        validate_booleans(keep_nodes, keep_ways, keep_relations)
-
         if self._nodes is None or self._way_records is None:
             self._read_pbf()
 
@@ -29,7 +29,12 @@ cdef get_ways_for_relation(member_ids, member_roles, building_relation_ways):
         member_ids = member_ids[member_mask]
         member_roles = member_roles[member_mask]
 
-    ways = filter_array_dict_by_indices_or_mask(building_relation_ways, mask)
+    # Only ids and nodes are needed for constructing the geometry,
+    # hence, other columns are not sliced
+    ways = filter_array_dict_by_indices_or_mask(
+        {"id": building_relation_ways["id"],
+         "nodes": building_relation_ways["nodes"]},
+        mask)
     return member_ids, member_roles, ways
 
 cdef get_relations(relations, relation_ways, node_coordinates):
@@ -37,9 +42,10 @@ cdef get_relations(relations, relation_ways, node_coordinates):
 
     prepared_relations = []
     for i in range(0, n):
-        rel = filter_array_dict_by_indices_or_mask(relations, [i])
-        tag_keys = list(rel["tags"][0].keys())
-        tag = rel["tags"][0]
+        # Access only the attributes that are needed
+        # instead of slicing all arrays of the relation
+        tag = relations["tags"][i]
+        tag_keys = tag.keys()
 
         # Check if geometry should NOT be polygon
         force_linestring = False
@@ -100,8 +106,9 @@ cdef get_relations(relations, relation_ways, node_coordinates):
                                "site", "cluster"]:
                 make_multipolygon = True
 
-        member_ids = rel["members"][0]["member_id"]
-        member_roles = rel["members"][0]["member_role"]
+        members = relations["members"][i]
+        member_ids = members["member_id"]
+        member_roles = members["member_role"]
 
         # Get ways for given relation
         member_ids, member_roles, ways = get_ways_for_relation(member_ids,
@@ -142,15 +149,15 @@ cdef get_relations(relations, relation_ways, node_coordinates):
                 geometry = fix_geometry(geometry)
 
         relation = dict(
-            id=rel["id"][0],
-            version=rel["version"][0],
-            changeset=rel["changeset"][0],
-            timestamp=rel["timestamp"][0],
+            id=relations["id"][i],
+            version=relations["version"][i],
+            changeset=relations["changeset"][i],
+            timestamp=relations["timestamp"][i],
             geometry=geometry
         )
 
         # Add tags
-        for k, v in rel["tags"][0].items():
+        for k, v in tag.items():
             relation[k] = v
 
         prepared_relations.append(relation)
@@ -48,25 +48,22 @@ cdef explode_way_tags(ways):
     return exploded, list(way_keys.keys())
 
 cdef explode_tag_array(tag_array, tags_as_columns):
-    lookup = dict.fromkeys(tags_as_columns, None)
-    data = {k: [] for k in tags_as_columns}
-    data["tags"] = []
-    n = len(tag_array)
+    cdef int i, n = len(tag_array)
+    # Write values directly into preallocated columns
+    data = {k: [None] * n for k in tags_as_columns}
+    tags = [None] * n
     for i in range(0, n):
         tag = tag_array[i]
-        tag_records = dict.fromkeys(tags_as_columns, None)
         other_tags = {}
         for k, v in tag.items():
-            try:
-                # Check if tag should be kept as a column
-                lookup[k]
-                tag_records[k] = v
-            except:
+            # Check if tag should be kept as a column
+            column = data.get(k)
+            if column is not None:
+                column[i] = v
+            else:
                 # If not add into tags
                 other_tags[k] = v
-        [data[k].append(v) for k, v in tag_records.items()]
         if len(other_tags) > 0:
-            data["tags"].append(dumps(other_tags))
-        else:
-            data["tags"].append(None)
+            tags[i] = dumps(other_tags)
+    data["tags"] = tags
     return data
\ No newline at end of file
@@ -20,7 +20,8 @@ def get_user_defined_data(nodes,
         nodes = None
 
     # If wanting to parse relations but not ways,
-    # it is still necessary to parse ways as well at this point
+    # the ways belonging to relations are still needed
+    # (other ways are skipped already when filtering the data)
     if keep_ways is False and keep_relations is True:
         pass
     # If ways are not wanted, neither should relations be parsed
@@ -39,6 +40,7 @@ def get_user_defined_data(nodes,
                                                          data_filter=custom_filter,
                                                          filter_type=filter_type,
                                                          osm_keys=osm_keys,
+                                                         keep_ways=keep_ways,
                                                          )
 
     # If there weren't any data, return empty GeoDataFrame
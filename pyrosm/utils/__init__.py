@@ -53,20 +53,49 @@ def validate_tags_as_columns(tags_as_columns):
 
 
 def validate_booleans(keep_nodes, keep_ways, keep_relations):
-    if not isinstance(keep_nodes, bool):
-        raise ValueError("'keep_nodes' should be boolean type: True or False")
-
-    if not isinstance(keep_ways, bool):
-        raise ValueError("'keep_ways' should be boolean type: True or False")
-
-    if not isinstance(keep_relations, bool):
-        raise ValueError("'keep_relations' should be boolean type: True or False")
+    booleans = {"keep_nodes": keep_nodes,
+                "keep_ways": keep_ways,
+                "keep_relations": keep_relations}
+    for name, value in booleans.items():
+        if type(value) is not bool:
+            raise ValueError(f"'{name}' should be boolean type: True or False")
 
     if keep_nodes is False and keep_ways is False and keep_relations is False:
         raise ValueError("At least on of the following parameters should be True: "
                          "'keep_nodes', 'keep_ways', or 'keep_relations'")
 
 
+def validate_custom_criteria(custom_filter, osm_keys_to_keep, filter_type,
+                             tags_as_columns, keep_nodes, keep_ways,
+                             keep_relations, extra_attributes):
+    """
+    Validates all parameters of a custom criteria query at once,
+    so that invalid input is caught before any data is parsed.
+    Returns the custom filter, OSM keys and filter type in normalized form.
+    """
+    custom_filter = validate_custom_filter(custom_filter)
+
+    validate_osm_keys(osm_keys_to_keep)
+    if isinstance(osm_keys_to_keep, str):
+        osm_keys_to_keep = [osm_keys_to_keep]
+
+    if not isinstance(filter_type, str):
+        raise ValueError("'filter_type' -parameter should be either 'keep' or 'exclude'. ")
+    filter_type = filter_type.lower()
+    if filter_type not in ["keep", "exclude"]:
+        raise ValueError("'filter_type' -parameter should be either 'keep' or 'exclude'. ")
+
+    if tags_as_columns is not None:
+        validate_tags_as_columns(tags_as_columns)
+
+    if extra_attributes is not None:
+        validate_tags_as_columns(extra_attributes)
+
+    validate_booleans(keep_nodes, keep_ways, keep_relations)
+
+    return custom_filter, osm_keys_to_keep, filter_type
+
+
 def validate_boundary_type(boundary_type):
     allowed_boundary_types = ["administrative", "national_park", "political",
                               "postal_code", "protected_area", "aboriginal_lands",
@@ -2,24 +2,38 @@ import pytest
 from pyrosm import get_data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_pbf():
     pbf_path = get_data("test_pbf")
     return pbf_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def helsinki_pbf():
     pbf_path = get_data("helsinki_pbf")
     return pbf_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def helsinki_region_pbf():
     pbf_path = get_data("helsinki_region_pbf")
     return pbf_path
 
 
+@pytest.fixture(scope="session")
+def osm_test(test_pbf):
+    from pyrosm import OSM
+    osm = OSM(filepath=test_pbf)
+    # Get first all data
+    return osm, osm.get_buildings()
+
+
+@pytest.fixture(scope="session")
+def helsinki_osm(helsinki_pbf):
+    from pyrosm import OSM
+    return OSM(filepath=helsinki_pbf)
+
+
 @pytest.fixture
 def default_filter():
     return {"amenity": True,
@@ -31,7 +45,7 @@ def default_filter():
             }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_output_dir():
     import os, tempfile
     return os.path.join(tempfile.gettempdir(), "pyrosm_test_results")
@@ -123,42 +137,23 @@ def test_using_incorrect_filter(test_pbf):
     # Test that passing incorrect data works as should
     # 1.
     custom_filter = None
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter)
-    except ValueError as e:
-        if "should be a Python dictionary" in str(e):
-            pass
-        else:
-            raise e
+    with pytest.raises(ValueError, match="should be a Python dictionary"):
+        osm.get_data_by_custom_criteria(custom_filter=custom_filter)
 
-    custom_filter = {"building": [1]}
     # 2.
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter)
-    except ValueError as e:
-        if "string" in str(e):
-            pass
-        else:
-            raise e
+    custom_filter = {"building": [1]}
+    with pytest.raises(ValueError, match="string"):
+        osm.get_data_by_custom_criteria(custom_filter=custom_filter)
 
-    custom_filter = {"building": ["correct_string", 1]}
     # 3.
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter)
-    except ValueError as e:
-        if "string" in str(e):
-            pass
-        else:
-            raise e
+    custom_filter = {"building": ["correct_string", 1]}
+    with pytest.raises(ValueError, match="string"):
+        osm.get_data_by_custom_criteria(custom_filter=custom_filter)
+
     # 4.
     custom_filter = {0: ["residential"]}
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter)
-    except ValueError as e:
-        if "string" in str(e):
-            pass
-        else:
-            raise e
+    with pytest.raises(ValueError, match="string"):
+        osm.get_data_by_custom_criteria(custom_filter=custom_filter)
 
 
 def test_using_incorrect_tags(test_pbf):
@@ -170,15 +165,10 @@ def test_using_incorrect_tags(test_pbf):
     tags_as_columns = [1]
     custom_filter = {"building": ["retail"]}
     # Test that passing incorrect data works as should
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter,
-                                             tags_as_columns=tags_as_columns
-                                             )
-    except ValueError as e:
-        if "All tags listed in 'tags_as_columns' should be strings" in str(e):
-            pass
-        else:
-            raise e
+    with pytest.raises(ValueError, match="All tags listed in 'tags_as_columns' should be strings"):
+        osm.get_data_by_custom_criteria(custom_filter=custom_filter,
+                                        tags_as_columns=tags_as_columns
+                                        )
 
 
 def test_using_incorrect_filter_type(test_pbf):
@@ -188,66 +178,37 @@ def test_using_incorrect_filter_type(test_pbf):
     custom_filter = {"building": ["retail"]}
     filter_type = "incorrect_test"
     # Test that passing incorrect data works as should
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter,
-                                             filter_type=filter_type
-                                             )
-    except ValueError as e:
-        if "should be either 'keep' or 'exclude'" in str(e):
-            pass
-        else:
-            raise e
+    with pytest.raises(ValueError, match="should be either 'keep' or 'exclude'"):
+        osm.get_data_by_custom_criteria(custom_filter=custom_filter,
+                                        filter_type=filter_type
+                                        )
 
 
-def test_using_incorrect_booleans(test_pbf):
+@pytest.mark.parametrize("arg", ["keep_nodes", "keep_ways", "keep_relations"])
+def test_using_incorrect_booleans(test_pbf, arg):
     from pyrosm import OSM
     osm = OSM(filepath=test_pbf)
 
     custom_filter = {"building": ["retail"]}
     incorrect_bool = "foo"
     # Test that passing incorrect data works as should
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter,
-                                             keep_nodes=incorrect_bool
-                                             )
-    except ValueError as e:
-        if "'keep_nodes' should be boolean type: True or False" in str(e):
-            pass
-        else:
-            raise e
-
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter,
-                                             keep_ways=incorrect_bool
-                                             )
-    except ValueError as e:
-        if "'keep_ways' should be boolean type: True or False" in str(e):
-            pass
-        else:
-            raise e
-
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter,
-                                             keep_relations=incorrect_bool
-                                             )
-    except ValueError as e:
-        if "'keep_relations' should be boolean type: True or False" in str(e):
-            pass
-        else:
-            raise e
-
-
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter,
-                                             keep_relations=False,
-                                             keep_ways=False,
-                                             keep_nodes=False
-                                             )
-    except ValueError as e:
-        if "At least on of the following parameters should be True" in str(e):
-            pass
-        else:
-            raise e
+    with pytest.raises(ValueError, match=f"'{arg}' should be boolean type: True or False"):
+        osm.get_data_by_custom_criteria(custom_filter=custom_filter,
+                                        **{arg: incorrect_bool}
+                                        )
+
+
+def test_using_only_false_booleans(test_pbf):
+    from pyrosm import OSM
+    osm = OSM(filepath=test_pbf)
+
+    custom_filter = {"building": ["retail"]}
+    with pytest.raises(ValueError, match="At least on of the following parameters should be True"):
+        osm.get_data_by_custom_criteria(custom_filter=custom_filter,
+                                        keep_relations=False,
+                                        keep_ways=False,
+                                        keep_nodes=False
+                                        )
 
 
 def test_using_incorrect_osm_keys(test_pbf):
@@ -257,25 +218,17 @@ def test_using_incorrect_osm_keys(test_pbf):
     osm_keys = 1
     custom_filter = {"building": ["retail"]}
     # Test that passing incorrect data works as should
-    try:
-        gdf = osm.get_data_by_custom_criteria(custom_filter=custom_filter,
-                                             osm_keys_to_keep=osm_keys
-                                             )
-    except ValueError as e:
-        if "'osm_keys_to_keep' -parameter should be of type str or list." in str(e):
-            pass
-        else:
-            raise e
+    with pytest.raises(ValueError, match="'osm_keys_to_keep' -parameter should be of type str or list."):
+        osm.get_data_by_custom_criteria(custom_filter=custom_filter,
+                                        osm_keys_to_keep=osm_keys
+                                        )
 
 
-def test_reading_with_custom_filters_with_including(test_pbf):
-    from pyrosm import OSM
+def test_reading_with_custom_filters_with_including(osm_test):
     from shapely.geometry import Polygon
     from geopandas import GeoDataFrame
 
-    # Get first all data
-    osm = OSM(filepath=test_pbf)
-    gdf_all = osm.get_buildings()
+    osm, gdf_all = osm_test
 
     # Find out all 'building' tags
     cnts = gdf_all['building'].value_counts()
@@ -296,14 +249,11 @@ def test_reading_with_custom_filters_with_including(test_pbf):
             assert col in filtered.columns
 
 
-def test_reading_with_custom_filters_with_excluding(test_pbf):
-    from pyrosm import OSM
+def test_reading_with_custom_filters_with_excluding(osm_test):
     from shapely.geometry import Polygon
     from geopandas import GeoDataFrame
 
-    # Get first all data
-    osm = OSM(filepath=test_pbf)
-    gdf_all = osm.get_buildings()
+    osm, gdf_all = osm_test
 
     # Find out all 'building' tags
     cnts = gdf_all['building'].value_counts()
@@ -325,54 +275,29 @@ def test_reading_with_custom_filters_with_excluding(test_pbf):
             assert col in filtered.columns
 
 
-def test_reading_with_custom_filters_selecting_specific_osm_element(helsinki_pbf):
-    from pyrosm import OSM
+@pytest.mark.parametrize("keep_nodes,keep_ways,keep_relations,osm_type,expected_len",
+                         [(False, False, True, "relation", 66),
+                          (False, True, False, "way", 422),
+                          (True, False, False, "node", 36)])
+def test_reading_with_custom_filters_selecting_specific_osm_element(helsinki_osm,
+                                                                     keep_nodes,
+                                                                     keep_ways,
+                                                                     keep_relations,
+                                                                     osm_type,
+                                                                     expected_len):
     from geopandas import GeoDataFrame
 
-    # Get first all data
-    osm = OSM(filepath=helsinki_pbf)
-
-    # Test getting only relations
-    # ---------------------------
-    filtered = osm.get_data_by_custom_criteria(custom_filter={'building': True},
-                                              filter_type="keep",
-                                              keep_nodes=False,
-                                              keep_ways=False,
-                                              keep_relations=True)
-    assert isinstance(filtered, GeoDataFrame)
-
-    # Now should only have 'relation' osm_type
-    assert len(filtered['osm_type'].unique()) == 1
-    assert filtered['osm_type'].unique()[0] == 'relation'
-    assert len(filtered) == 66
-
-    # Test getting only ways
-    # ---------------------------
-    filtered = osm.get_data_by_custom_criteria(custom_filter={'building': True},
-                                              filter_type="keep",
-                                              keep_nodes=False,
-                                              keep_ways=True,
-                                              keep_relations=False)
-    assert isinstance(filtered, GeoDataFrame)
-
-    # Now should only have 'way' osm_type
-    assert len(filtered['osm_type'].unique()) == 1
-    assert filtered['osm_type'].unique()[0] == 'way'
-    assert len(filtered) == 422
-
-    # Test getting only nodes
-    # ---------------------------
-    filtered = osm.get_data_by_custom_criteria(custom_filter={'building': True},
-                                              filter_type="keep",
-                                              keep_nodes=True,
-                                              keep_ways=False,
-                                              keep_relations=False)
+    filtered = helsinki_osm.get_data_by_custom_criteria(custom_filter={'building': True},
+                                                        filter_type="keep",
+                                                        keep_nodes=keep_nodes,
+                                                        keep_ways=keep_ways,
+                                                        keep_relations=keep_relations)
     assert isinstance(filtered, GeoDataFrame)
 
-    # Now should only have 'node' osm_type
+    # Now should only have the requested osm_type
     assert len(filtered['osm_type'].unique()) == 1
-    assert filtered['osm_type'].unique()[0] == 'node'
-    assert len(filtered) == 36
+    assert filtered['osm_type'].unique()[0] == osm_type
+    assert len(filtered) == expected_len
 
 
 def test_custom_filters_with_custom_keys(helsinki_region_pbf):
@@ -479,6 +404,22 @@ def test_reading_custom_from_area_having_none(helsinki_pbf):
     assert gdf is None
 
 
+def test_reading_only_relations_without_matches(test_pbf):
+    from pyrosm import OSM
+
+    osm = OSM(filepath=test_pbf)
+
+    # Test data has highway ways but no highway relations
+    with pytest.warns(UserWarning, match="Could not find any OSM data"):
+        gdf = osm.get_data_by_custom_criteria({"highway": True},
+                                              keep_nodes=False,
+                                              keep_ways=False,
+                                              keep_relations=True)
+
+    # Result should be None
+    assert gdf is None
+
+
 def test_adding_extra_attribute(helsinki_pbf):
     from pyrosm import OSM
     from geopandas import GeoDataFrame